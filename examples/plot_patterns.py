@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import math
-from typing import Iterable, List, Sequence, Tuple
+from typing import Iterable, Sequence, Tuple, Union
 
 # Local import support when running the script directly from the repo
 import sys
@@ -16,37 +17,48 @@ for path in (SRC_DIR, REPO_ROOT):
     if path_str not in sys.path:
         sys.path.insert(0, path_str)
 
-import matplotlib.pyplot as plt
+import numpy as np
 
 from xyplotter import (
     WorkArea,
     available_patterns,
-    hilbert_curve,
+    hilbert_curve_array,
+    pattern_array,
     resolve_pattern,
 )
 
 Point = Tuple[float, float]
 
+_PATTERN_NAMES = available_patterns()
 
-def sample_pattern(area: WorkArea, pattern_name: str, max_points: int) -> List[Point]:
-    """Collect points from a named pattern with a safety cap."""
-    generator = resolve_pattern(pattern_name)(area)
-    points: List[Point] = []
 
-    for idx, pt in enumerate(generator):
-        if max_points and idx >= max_points:
-            break
-        points.append(pt)
+def sample_pattern(area: WorkArea, pattern_name: str, max_points: int) -> np.ndarray:
+    """Collect points from a named pattern with a safety cap."""
+    if not max_points:
+        # Uncapped: vectorized array form of the pattern, cached per work area by the library
+        return pattern_array(area, pattern_name)
 
-    return points
+    # Stop pulling from the generator at the cap; nothing is written to the disk cache
+    generator = resolve_pattern(pattern_name)(area)
+    return np.fromiter(
+        itertools.islice(generator, max_points),
+        dtype=np.dtype((np.float64, 2)),
+    )
 
 
-def plot_path(ax, points: Sequence[Point], area: WorkArea, title: str) -> None:
+def plot_path(
+    ax,
+    points: Union[Sequence[Point], np.ndarray],
+    area: WorkArea,
+    title: str,
+    gradient: bool = True,
+) -> None:
     """Plot path segments in order, similar to how the plotter would move."""
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    pts_arr = np.asarray(points, dtype=np.float64)
     ax.set_title(title)
-    ax.set_aspect("equal", adjustable="box")
-    ax.set_xlim(area.xmin, area.xmax)
-    ax.set_ylim(area.ymin, area.ymax)
 
     # Draw work envelope
     ax.plot(
@@ -57,31 +69,49 @@ def plot_path(ax, points: Sequence[Point], area: WorkArea, title: str) -> None:
         linewidth=1,
     )
 
-    if len(points) < 2:
+    if len(pts_arr) < 2:
         return
 
-    xs, ys = zip(*points)
-    # Color path by progress to mimic time ordering
-    colors = [i / (len(points) - 1) for i in range(len(points) - 1)]
-    for i in range(len(points) - 1):
-        ax.plot(
-            [points[i][0], points[i + 1][0]],
-            [points[i][1], points[i + 1][1]],
-            color=plt.cm.viridis(colors[i]),
-            linewidth=1.2,
-        )
+    if gradient:
+        # Color path by progress to mimic time ordering; one collection holds all segments
+        segments = np.stack([pts_arr[:-1], pts_arr[1:]], axis=1)
+        colors = plt.cm.viridis(np.arange(len(segments)) / (len(pts_arr) - 1))
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.2))
+    else:
+        # Single path artist, much cheaper to render for dense patterns
+        ax.plot(pts_arr[:, 0], pts_arr[:, 1], color="tab:blue", linewidth=1.2)
 
     # Mark start and end
-    ax.scatter(xs[0], ys[0], c="red", s=20, label="start", zorder=3)
-    ax.scatter(xs[-1], ys[-1], c="black", s=16, label="end", zorder=3)
+    ax.scatter(pts_arr[0, 0], pts_arr[0, 1], c="red", s=20, label="start", zorder=3)
+    ax.scatter(pts_arr[-1, 0], pts_arr[-1, 1], c="black", s=16, label="end", zorder=3)
     ax.legend(loc="upper right", fontsize="small", framealpha=0.8)
 
 
+def make_axes(rows: int, cols: int, panel_size: float, area: WorkArea) -> list:
+    """Create a flat list of equal-aspect axes that share the work-area limits."""
+    import matplotlib.pyplot as plt
+
+    _, axes = plt.subplots(
+        rows,
+        cols,
+        figsize=(panel_size * cols, panel_size * rows),
+        sharex=True,
+        sharey=True,
+        subplot_kw={"aspect": "equal"},
+        constrained_layout=True,
+    )
+    axes = list(axes.flatten()) if isinstance(axes, Iterable) else [axes]
+    # Shared axes propagate the limits to every panel
+    axes[0].set_xlim(area.xmin, area.xmax)
+    axes[0].set_ylim(area.ymin, area.ymax)
+    return axes
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Plot XY plotter patterns.")
     parser.add_argument(
         "--pattern",
-        choices=available_patterns(),
+        choices=_PATTERN_NAMES,
         default="center_out_refined_spiral",
         help="Pattern name to plot (ignored if --all is set).",
     )
@@ -107,6 +137,11 @@ def main() -> None:
         default=2.0,
         help="Controls how quickly sweeps get denser (used for non-Hilbert patterns).",
     )
+    parser.add_argument(
+        "--no-gradient",
+        action="store_true",
+        help="Draw each path in a single color instead of coloring by progress (faster).",
+    )
     args = parser.parse_args()
 
     if args.sweeps < 1:
@@ -114,17 +149,19 @@ def main() -> None:
     if args.density_factor <= 1.0 and not args.all and args.sweeps > 1:
         parser.error("--density-factor must be > 1 when using multiple sweeps")
 
+    # Imported after argument parsing so --help and argument errors stay fast
+    import matplotlib.pyplot as plt
+
     area = WorkArea(width=args.width, height=args.height, margin=args.margin)
-    pattern_names = list(available_patterns()) if args.all else [args.pattern]
+    pattern_names = list(_PATTERN_NAMES) if args.all else [args.pattern]
 
     if args.all:
         cols = math.ceil(math.sqrt(len(pattern_names)))
         rows = math.ceil(len(pattern_names) / cols)
-        fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 4 * rows))
-        axes = axes.flatten() if isinstance(axes, Iterable) else [axes]
+        axes = make_axes(rows, cols, 4, area)
         for ax, name in zip(axes, pattern_names):
             pts = sample_pattern(area, name, args.max_points)
-            plot_path(ax, pts, area, name)
+            plot_path(ax, pts, area, name, gradient=not args.no_gradient)
         # Hide any unused axes
         for ax in axes[len(pattern_names) :]:
             ax.axis("off")
@@ -132,37 +169,37 @@ def main() -> None:
         pattern_name = pattern_names[0]
         cols = min(3, args.sweeps)
         rows = math.ceil(args.sweeps / cols)
-        fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 5 * rows))
-        axes = axes.flatten() if isinstance(axes, Iterable) else [axes]
+        axes = make_axes(rows, cols, 5, area)
 
         if pattern_name == "hilbert":
             # Increase Hilbert order each sweep. Total points per order: (2**order)^2 = 4**order
             max_order = max(1, int(math.log(max(args.max_points, 1), 4)))
             orders = [min(i + 1, max_order) for i in range(args.sweeps)]
             for ax, order in zip(axes, orders):
-                pts = list(hilbert_curve(area, order=order))
+                pts = hilbert_curve_array(area, order=order)
                 title = f"{pattern_name} (order {order})"
-                plot_path(ax, pts, area, title)
+                plot_path(ax, pts, area, title, gradient=not args.no_gradient)
             used_axes = len(orders)
         else:
             # Build multiple sweeps from coarse to dense by subsampling the full pattern
             full_pts = sample_pattern(area, pattern_name, args.max_points)
             sweeps = args.sweeps
             # stride decreases each sweep so density increases; last sweep is stride 1
-            strides = [
-                max(1, int(round(args.density_factor ** (sweeps - i - 1))))
-                for i in range(sweeps)
-            ]
+            exponents = np.arange(sweeps - 1, -1, -1)
+            with np.errstate(over="ignore"):
+                raw_strides = np.round(args.density_factor ** exponents.astype(np.float64))
+            # Clip before casting: strides past the point count overflow int64 and add nothing
+            raw_strides = np.clip(raw_strides, 1, max(len(full_pts), 1))
+            strides = raw_strides.astype(int).tolist()
             for sweep_idx, (ax, stride) in enumerate(zip(axes, strides), start=1):
                 pts = full_pts[::stride] if stride > 1 else full_pts
                 title = f"{pattern_name} (sweep {sweep_idx}, stride {stride})"
-                plot_path(ax, pts, area, title)
+                plot_path(ax, pts, area, title, gradient=not args.no_gradient)
             used_axes = len(strides)
 
         for ax in axes[used_axes:]:
             ax.axis("off")
 
-    plt.tight_layout()
     plt.show()
 
 
@@ -1,17 +1,12 @@
 import argparse
 import math
 import sys
+from collections import deque
 import numpy as np
 import time
 import zmq
 
 
-context = zmq.Context()
-
-# iq_socket = context.socket(zmq.PUB)
-
-# iq_socket.bind(f"tcp://*:{50001}")
-
 # Simple ANSI coloring for logs
 USE_COLOR = sys.stdout.isatty()
 
@@ -23,6 +18,9 @@ def _c(text: str, code: str) -> str:
 
 
 class ACRO:
+    RX_BUFFER_SIZE = 127  # GRBL serial RX buffer (128 bytes, one kept free)
+    _MOVE_FMT = b"G0 X%.3f Y%.3f F%d\n"  # (F = mm/min)
+
     def __init__(self, COMport):
         try:
             import serial  # local import so plotting mode works without pyserial
@@ -48,7 +46,7 @@ class ACRO:
                 print(_c("Alarm detected after init; sending $X (unlock) and rechecking.", "91"))
                 try:
                     self.ser.write(b"$X\n")
-                    time.sleep(0.2)
+                    self._read_ack()
                     follow = self.get_status()
                     if follow:
                         color = "91" if "Alarm" in follow else "92"
@@ -64,13 +62,14 @@ class ACRO:
                     pass
 
     def wait_till_idle(self):
-        response = ""
+        attempt = 0
         while True:
-            time.sleep(0.1)
+            # Poll fast right after a command, backing off while the machine is busy
+            time.sleep(min(0.08, 0.005 * 1.5**attempt))
+            attempt += 1
 
-            self.ser.flushInput()
-            self.ser.write(b"?\n")
-            response = self.ser.readline().decode().strip()
+            self.ser.write(b"?")  # real-time status query, no newline needed
+            response = self._read_status()
             if response:
                 if "Alarm" in response:
                     print(_c(f"[alarm] {response}", "91"))
@@ -81,40 +80,66 @@ class ACRO:
                 break
 
     def home_ACRO(self):
-        # Send the query command
-        self.ser.write(b"G54\n")
-        self.ser.write(b"?\n")
-
-        self.wait_till_idle()
-
-        # Read and decode the response
-        response = self.ser.readline().decode().strip()
-        # print("Controller response:", response)
-
-        # Send homing command
-        command = f"$H\n"  # Command to start homing
-        self.ser.write(command.encode())
+        # Homing is the only slow step; the zeroing commands queue up behind it in GRBL
+        self.ser.write(b"$H\nG10 P0 L20 X0 Y0 Z0\nG54\n")
+        for _ in range(3):
+            self._read_ack()  # $H is acknowledged once the homing cycle has finished
         self.wait_till_idle()  # Wait until controller reports idle state
 
-        self.ser.write("G10 P0 L20 X0 Y0 Z0\n".encode())
-        self.wait_till_idle()
-
-        self.ser.write(b"G54\n")
-        self.ser.write(b"?\n")
-
-        self.wait_till_idle()
-
         print("Machine is homed")
 
     def move_ACRO(self, x, y, wait_idle=True, speed=50):
-        command = f"G0 X{x:.3f} Y{y:.3f} F{int(speed)}\n"  # Command to move to specific location (F = mm/min)
-        self.ser.write(command.encode())  # Send command to move to a specific position
+        self.ser.write(self._MOVE_FMT % (x, y, speed))  # Send command to move to a specific position
+        self._read_ack()
         if wait_idle:
             self.wait_till_idle()  # Wait until controller reports idle state
 
+    def move_many(self, points, speed=50):
+        """Stream a batch of moves using GRBL's character-counting protocol.
+
+        Lines are written in as few serial writes as possible while keeping the
+        bytes awaiting an ``ok`` within GRBL's RX buffer. Every other command reads
+        its own ``ok`` right away, so each ack read here belongs to a line below.
+        """
+        fmt, speed = self._MOVE_FMT, int(speed)
+        lines = [fmt % (x, y, speed) for x, y in np.asarray(points).tolist()]
+
+        inflight = deque()
+        buffered = 0
+        batch = []
+        for line in lines:
+            while inflight and buffered + len(line) > self.RX_BUFFER_SIZE:
+                if batch:
+                    self.ser.write(b"".join(batch))
+                    batch = []
+                self._read_ack()
+                buffered -= inflight.popleft()
+            batch.append(line)
+            inflight.append(len(line))
+            buffered += len(line)
+
+        if batch:
+            self.ser.write(b"".join(batch))
+        while inflight:
+            self._read_ack()
+            inflight.popleft()
+
+    def _read_ack(self) -> str:
+        """Block until GRBL acknowledges one line with ok or error."""
+        while True:
+            response = self.ser.readline().decode(errors="ignore").strip()
+            if response.startswith("ok"):
+                return response
+            if response.startswith("error"):
+                print(_c(f"[grbl] {response}", "91"))
+                return response
+            if response.startswith("ALARM"):
+                print(_c(f"[alarm] {response}", "91"))
+
     def move_ACRO_to_origin(self):
         command = f"G0 X0 Y0\n"  # Command to move to specific location
         self.ser.write(command.encode())
+        self._read_ack()
         self.wait_till_idle()  # Wait until controller reports idle state
 
     def close_ACRO(self):
@@ -131,8 +156,15 @@ class ACRO:
 
     def get_status(self) -> str:
         """Send ? and return one status line (or empty string)."""
-        self.ser.write(b"?\n")
-        return self.ser.readline().decode(errors="ignore").strip()
+        self.ser.write(b"?")
+        return self._read_status()
+
+    def _read_status(self) -> str:
+        """Read lines until a <...> status report, skipping acks left in the input buffer."""
+        while True:
+            response = self.ser.readline().decode(errors="ignore").strip()
+            if not response or response.startswith("<"):
+                return response
 
 
 def wait_till_pressed():
@@ -146,6 +178,7 @@ def wait_till_go_from_server():
     global meas_id, file_open, data_file, file_name
     # Connect to the publisher's address
     print("Connecting to server %s.", SERVER_IP)
+    context = zmq.Context.instance()
     sync_socket = context.socket(zmq.SUB)
 
     alive_socket = context.socket(zmq.REQ)
@@ -170,11 +203,35 @@ def wait_till_go_from_server():
 
 def compute_spacing_for_sweep(start_spacing: float, min_spacing: float, decay: float, target_sweep: int) -> float:
     """Compute the spacing that would be in effect at a given sweep number."""
-    spacing = start_spacing
-    for s in range(1, target_sweep):
-        if s > 1 and s % 2 == 1:
-            spacing = max(min_spacing, spacing * decay)
-    return spacing
+    # Spacing decays once for every odd sweep number in [3, target_sweep - 1]
+    decay_steps = max(0, (target_sweep - 2) // 2)
+    if decay_steps == 0:
+        return start_spacing
+    return max(min_spacing, start_spacing * decay**decay_steps)
+
+
+def serpentine_sweep_path(
+    center: tuple[float, float],
+    lines: np.ndarray,
+    low: float,
+    high: float,
+    column: bool,
+) -> np.ndarray:
+    """Build the (N, 2) serpentine path for one sweep, starting at the center.
+
+    Each entry of ``lines`` is a fixed X (column sweep) or Y (row sweep) that is
+    traversed from ``low`` to ``high``, alternating direction on every line.
+    """
+    fixed_axis, travel_axis = (0, 1) if column else (1, 0)
+    even = np.arange(lines.size) % 2 == 0
+
+    pts = np.empty((2 * lines.size + 1, 2), dtype=np.float64)
+    pts[0] = center
+    pts[1::2, fixed_axis] = lines
+    pts[2::2, fixed_axis] = lines
+    pts[1::2, travel_axis] = np.where(even, low, high)
+    pts[2::2, travel_axis] = np.where(even, high, low)
+    return pts
 
 
 def generate_sweep_points(
@@ -187,9 +244,10 @@ def generate_sweep_points(
     start_spacing: float = 120.0,
     decay: float = 0.75,
     min_spacing: float = 20.0,
-) -> list[tuple[int, list[tuple[float, float]]]]:
+) -> list[tuple[int, np.ndarray]]:
     """Replicate the sweep path without driving hardware."""
-    all_sweeps: list[tuple[int, list[tuple[float, float]]]] = []
+    all_sweeps: list[tuple[int, np.ndarray]] = []
+    path_cache: dict[tuple[float, bool, bool], np.ndarray] = {}
     spacing = compute_spacing_for_sweep(start_spacing, min_spacing, decay, start_sweep)
     center = ((x_min + x_max) / 2, (y_min + y_max) / 2)
     sweep_number = start_sweep
@@ -197,33 +255,27 @@ def generate_sweep_points(
         if sweep_number > 1 and sweep_number % 2 == 1 and sweep_number != start_sweep:
             spacing = max(min_spacing, spacing * decay)
 
-        x_offset = (spacing / 2) if sweep_number % 2 == 0 else 0
-        y_offset = (spacing / 2) if sweep_number % 3 == 0 else 0
+        # The path only depends on spacing and the two offset parities, so sweeps
+        # that repeat a layout (e.g. once spacing bottoms out) reuse the array.
+        key = (spacing, sweep_number % 2 == 0, sweep_number % 3 == 0)
+        pts = path_cache.get(key)
+        if pts is None:
+            x_offset = (spacing / 2) if sweep_number % 2 == 0 else 0
+            y_offset = (spacing / 2) if sweep_number % 3 == 0 else 0
 
-        x_lines = np.arange(x_min + x_offset, x_max, spacing)
-        y_lines = np.arange(y_min + y_offset, y_max, spacing)
+            x_lines = np.arange(x_min + x_offset, x_max, spacing)
+            y_lines = np.arange(y_min + y_offset, y_max, spacing)
 
-        if len(x_lines) == 0 or len(y_lines) == 0:
-            x_lines = np.arange(x_min, x_max, spacing)
-            y_lines = np.arange(y_min, y_max, spacing)
+            if x_lines.size == 0 or y_lines.size == 0:
+                x_lines = np.arange(x_min, x_max, spacing)
+                y_lines = np.arange(y_min, y_max, spacing)
 
-        pts: list[tuple[float, float]] = [center]
-        if sweep_number % 2 == 0:
-            for idx, x_val in enumerate(x_lines):
-                if idx % 2 == 0:
-                    pts.append((x_val, y_min))
-                    pts.append((x_val, y_max))
-                else:
-                    pts.append((x_val, y_max))
-                    pts.append((x_val, y_min))
-        else:
-            for idx, y_val in enumerate(y_lines):
-                if idx % 2 == 0:
-                    pts.append((x_min, y_val))
-                    pts.append((x_max, y_val))
-                else:
-                    pts.append((x_max, y_val))
-                    pts.append((x_min, y_val))
+            if sweep_number % 2 == 0:
+                pts = serpentine_sweep_path(center, x_lines, y_min, y_max, column=True)
+            else:
+                pts = serpentine_sweep_path(center, y_lines, x_min, x_max, column=False)
+            pts.flags.writeable = False
+            path_cache[key] = pts
 
         all_sweeps.append((sweep_number, pts))
         sweep_number += 1
@@ -231,7 +283,7 @@ def generate_sweep_points(
 
 
 def plot_sweeps(
-    sweeps: list[tuple[int, list[tuple[float, float]]]],
+    sweeps: list[tuple[int, np.ndarray]],
     x_min: float,
     x_max: float,
     y_min: float,
@@ -239,32 +291,42 @@ def plot_sweeps(
 ) -> None:
     """Scatter and connect each sweep; include a combined view."""
     import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
 
     total_plots = len(sweeps) + 1
     cols = 5
     rows = math.ceil(total_plots / cols)
-    fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 4 * rows))
+    fig, axes = plt.subplots(
+        rows,
+        cols,
+        figsize=(4 * cols, 4 * rows),
+        sharex=True,
+        sharey=True,
+        subplot_kw={"aspect": "equal"},
+        constrained_layout=True,
+    )
     axes = axes.flatten()
+    # Shared axes propagate the limits to every panel
+    axes[0].set_xlim(x_min, x_max)
+    axes[0].set_ylim(y_min, y_max)
+
+    envelope = np.array([[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max], [x_min, y_min]])
 
     def draw_envelope(ax):
-        ax.plot(
-            [x_min, x_max, x_max, x_min, x_min],
-            [y_min, y_min, y_max, y_max, y_min],
-            color="gray",
-            linestyle="--",
-            linewidth=1,
-        )
+        ax.plot(envelope[:, 0], envelope[:, 1], color="gray", linestyle="--", linewidth=1)
 
-    for idx, (ax, sweep_entry) in enumerate(zip(axes, sweeps), start=1):
+    # One colormap lookup for all sweeps; panels share colors with the combined view
+    palette = plt.cm.plasma(np.arange(len(sweeps)) / max(len(sweeps) - 1, 1))
+
+    for idx, (ax, sweep_entry) in enumerate(zip(axes, sweeps)):
         sweep_number, pts = sweep_entry
         ax.set_title(f"Sweep {sweep_number}")
-        ax.set_aspect("equal", adjustable="box")
-        ax.set_xlim(x_min, x_max)
-        ax.set_ylim(y_min, y_max)
         draw_envelope(ax)
         if len(pts) > 1:
-            xs, ys = zip(*pts)
-            color = plt.cm.plasma((sweep_number - sweeps[0][0]) / max(len(sweeps), 1))
+            pts_arr = np.asarray(pts, dtype=np.float64)
+            xs, ys = pts_arr[:, 0], pts_arr[:, 1]
+            color = palette[idx]
             ax.plot(xs, ys, linewidth=1.2, color=color, alpha=0.8)
             ax.scatter(xs, ys, c=[color], s=10, alpha=0.8, zorder=3)
             ax.scatter(xs[0], ys[0], c="lime", edgecolor="black", s=36, zorder=4, label="start")
@@ -275,18 +337,21 @@ def plot_sweeps(
     if combined_ax_index < len(axes):
         ax = axes[combined_ax_index]
         ax.set_title("All sweeps")
-        ax.set_aspect("equal", adjustable="box")
-        ax.set_xlim(x_min, x_max)
-        ax.set_ylim(y_min, y_max)
         draw_envelope(ax)
-        for idx, sweep_entry in enumerate(sweeps):
-            sweep_number, pts = sweep_entry
-            if len(pts) < 2:
-                continue
-            xs, ys = zip(*pts)
-            color = plt.cm.plasma(idx / max(len(sweeps) - 1, 1))
-            ax.plot(xs, ys, linewidth=1.1, color=color, alpha=0.85, label=f"Sweep {sweep_number}")
-            ax.scatter(xs, ys, c=[color], s=10, alpha=0.75, edgecolor="none")
+        # One collection for all sweep paths and one scatter for all their points
+        drawn = [idx for idx, (_, pts) in enumerate(sweeps) if len(pts) >= 2]
+        sweep_handles = []
+        if drawn:
+            paths = [np.asarray(sweeps[idx][1], dtype=np.float64) for idx in drawn]
+            colors = palette[drawn]
+            ax.add_collection(LineCollection(paths, colors=colors, linewidths=1.1, alpha=0.85))
+            all_pts = np.concatenate(paths)
+            point_colors = np.repeat(colors, [len(path) for path in paths], axis=0)
+            ax.scatter(all_pts[:, 0], all_pts[:, 1], c=point_colors, s=10, alpha=0.75, edgecolor="none")
+            sweep_handles = [
+                Line2D([], [], linewidth=1.1, color=palette[idx], alpha=0.85, label=f"Sweep {sweeps[idx][0]}")
+                for idx in drawn
+            ]
         if len(sweeps) > 0 and len(sweeps[0][1]) > 0:
             ax.scatter(
                 sweeps[0][1][0][0],
@@ -297,12 +362,12 @@ def plot_sweeps(
                 zorder=3,
                 label="start (sweep 1)",
             )
-        ax.legend(loc="upper right", fontsize="x-small", framealpha=0.7)
+        start_handles, _ = ax.get_legend_handles_labels()
+        ax.legend(handles=sweep_handles + start_handles, loc="upper right", fontsize="x-small", framealpha=0.7)
 
     for ax in axes[total_plots:]:
         ax.axis("off")
 
-    plt.tight_layout()
     plt.show()
 
 
@@ -363,18 +428,14 @@ if __name__ == "__main__":
         plot_sweeps(sweeps, x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max)
         raise SystemExit(0)
 
+    # Optional IQ publisher; shares the process-wide context with wait_till_go_from_server
+    # iq_socket = zmq.Context.instance().socket(zmq.PUB)
+    # iq_socket.setsockopt(zmq.SNDHWM, 1024)
+    # iq_socket.bind(f"tcp://*:{50001}")
+
     ACRO = ACRO(COMport=args.port)
     ACRO.home_ACRO()
 
-    # x = [10,1250] # np.arange(0, 1250, 300/5) + 10  # np.arange(25, 1200, 300/100) + 25
-    # y = np.arange(0, 1250, 300/10) + 10
-
-    # xx, yy = np.meshgrid(x, y)
-    # xx[1::2] = xx[
-    #     1::2, ::-1
-    # ]  # flip the coordinates of x every other y to create a zig zag
-    # xx, yy = xx.ravel(), yy.ravel()
-
     center_x = (x_min + x_max) / 2
     center_y = (y_min + y_max) / 2
 
@@ -405,7 +466,7 @@ if __name__ == "__main__":
             x_lines = np.arange(x_min + x_offset, x_max, spacing)
             y_lines = np.arange(y_min + y_offset, y_max, spacing)
 
-            if len(x_lines) == 0 or len(y_lines) == 0:
+            if x_lines.size == 0 or y_lines.size == 0:
                 x_lines = np.arange(x_min, x_max, spacing)
                 y_lines = np.arange(y_min, y_max, spacing)
 
@@ -423,27 +484,14 @@ if __name__ == "__main__":
                 ACRO.move_ACRO(center_x, center_y, wait_idle=True, speed=args.speed)
 
             if sweep % 2 == 0:
-                # Column sweep: move along Y for each X
-                for idx, x_val in enumerate(x_lines):
-                    if idx % 2 == 0:
-                        # bottom -> top
-                        ACRO.move_ACRO(x_val, y_min, wait_idle=False, speed=args.speed)
-                        ACRO.move_ACRO(x_val, y_max, wait_idle=False, speed=args.speed)
-                    else:
-                        # top -> bottom
-                        ACRO.move_ACRO(x_val, y_max, wait_idle=False, speed=args.speed)
-                        ACRO.move_ACRO(x_val, y_min, wait_idle=False, speed=args.speed)
+                # Column sweep: move along Y for each X, alternating bottom/top
+                path = serpentine_sweep_path((center_x, center_y), x_lines, y_min, y_max, column=True)
             else:
-                # Row sweep: move along X for each Y
-                for idx, y_val in enumerate(y_lines):
-                    if idx % 2 == 0:
-                        # left -> right
-                        ACRO.move_ACRO(x_min, y_val, wait_idle=False, speed=args.speed)
-                        ACRO.move_ACRO(x_max, y_val, wait_idle=False, speed=args.speed)
-                    else:
-                        # right -> left
-                        ACRO.move_ACRO(x_max, y_val, wait_idle=False, speed=args.speed)
-                        ACRO.move_ACRO(x_min, y_val, wait_idle=False, speed=args.speed)
+                # Row sweep: move along X for each Y, alternating left/right
+                path = serpentine_sweep_path((center_x, center_y), y_lines, x_min, x_max, column=False)
+
+            # The leading center point is handled by the optional move above
+            ACRO.move_many(path[1:], speed=args.speed)
 
             # Ensure the controller finishes the sweep before the next one
             ACRO.wait_till_idle()
@@ -2,18 +2,27 @@
 
 from .xyplotter import (
     DEFAULT_PATTERN,
+    PATTERN_CACHE_DIR,
     PATTERN_REGISTRY,
     XYPlotter,
     WorkArea,
     available_patterns,
     center_out_refined_spiral,
+    center_out_refined_spiral_array,
     concentric_square_rings,
+    concentric_square_rings_array,
     hilbert_curve,
+    hilbert_curve_array,
+    pattern_array,
     phyllotaxis_fill,
+    phyllotaxis_fill_array,
     progressive_raster,
+    progressive_raster_array,
     radial_spokes,
+    radial_spokes_array,
     resolve_pattern,
     serpentine_grid,
+    serpentine_grid_array,
     wait_till_go_from_server,
 )
 
@@ -23,16 +32,25 @@ __all__ = [
     "XYPlotter",
     "WorkArea",
     "DEFAULT_PATTERN",
+    "PATTERN_CACHE_DIR",
     "PATTERN_REGISTRY",
     "available_patterns",
     "concentric_square_rings",
+    "concentric_square_rings_array",
     "center_out_refined_spiral",
+    "center_out_refined_spiral_array",
     "hilbert_curve",
+    "hilbert_curve_array",
+    "pattern_array",
     "phyllotaxis_fill",
+    "phyllotaxis_fill_array",
     "radial_spokes",
+    "radial_spokes_array",
     "resolve_pattern",
     "progressive_raster",
+    "progressive_raster_array",
     "serpentine_grid",
+    "serpentine_grid_array",
     "wait_till_go_from_server",
     "__version__",
 ]
@@ -1,10 +1,17 @@
 """XY plotter control utilities with built-in motion patterns."""
 from __future__ import annotations
 
+import functools
+import hashlib
 import math
+import os
+import re
+import sys
 import time
-from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 import numpy as np
 import zmq
@@ -15,57 +22,68 @@ except ImportError:  # pragma: no cover - optional for non-hardware workflows
     serial = None
 
 Point = Tuple[float, float]
+DEDUP_RESOLUTION = 0.01  # mm; consecutive points closer than this are merged
+# State and work/machine position of a "<State|MPos:x,y,z|...>" report
+_STATUS_RE = re.compile(rb"<([^|>]+)\|([WM])Pos:([\d.,\-]+)")
+# Built-in patterns are cached here as .npy files, keyed by this module's source
+PATTERN_CACHE_DIR = Path.home() / ".cache" / "xyplotter"
 PatternGenerator = Callable[["WorkArea"], Iterable[Point]]
 PatternInput = Union[str, PatternGenerator, None]
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkArea:
     """Simple rectangular work envelope."""
 
     width: float = 1250.0
     height: float = 1250.0
     margin: float = 10.0
+    # Bounds are derived once here; generators read them in tight loops
+    xmin: float = field(init=False, repr=False, compare=False)
+    xmax: float = field(init=False, repr=False, compare=False)
+    ymin: float = field(init=False, repr=False, compare=False)
+    ymax: float = field(init=False, repr=False, compare=False)
+    center: Point = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.margin * 2 >= self.width or self.margin * 2 >= self.height:
             raise ValueError("Margin leaves no space for movement in the work area")
-
-    @property
-    def xmin(self) -> float:
-        return self.margin
-
-    @property
-    def xmax(self) -> float:
-        return self.width - self.margin
-
-    @property
-    def ymin(self) -> float:
-        return self.margin
-
-    @property
-    def ymax(self) -> float:
-        return self.height - self.margin
-
-    @property
-    def center(self) -> Point:
-        return ((self.xmin + self.xmax) / 2, (self.ymin + self.ymax) / 2)
+        xmin, xmax = self.margin, self.width - self.margin
+        ymin, ymax = self.margin, self.height - self.margin
+        object.__setattr__(self, "xmin", xmin)
+        object.__setattr__(self, "xmax", xmax)
+        object.__setattr__(self, "ymin", ymin)
+        object.__setattr__(self, "ymax", ymax)
+        object.__setattr__(self, "center", ((xmin + xmax) / 2, (ymin + ymax) / 2))
 
     def clamp(self, x: float, y: float) -> Point:
         """Clamp a point to remain inside the work area."""
-        return (
-            min(max(x, self.xmin), self.xmax),
-            min(max(y, self.ymin), self.ymax),
-        )
+        return (min(max(x, self.xmin), self.xmax), min(max(y, self.ymin), self.ymax))
+
+    def clamp_array(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Clamp coordinate arrays to remain inside the work area."""
+        return np.clip(xs, self.xmin, self.xmax), np.clip(ys, self.ymin, self.ymax)
 
 
 class XYPlotter:
     """GRBL-based plotter controller for ACRO hardware."""
 
+    RX_BUFFER_SIZE = 128  # GRBL serial receive buffer, in bytes
+    LOOKAHEAD_LINES = 64  # lines formatted ahead while waiting for buffer space
+    _G0_FMT = b"G0 X%.3f Y%.3f F%g\n"
+
     def __init__(self, port: str, baudrate: int = 115200, timeout: float = 1.0):
         if serial is None:
             raise ImportError("pyserial is required for XYPlotter; install via `pip install pyserial`.")
-        self.ser = serial.Serial(port, baudrate=baudrate, timeout=timeout)
+        self.ser = serial.Serial(port, baudrate=baudrate, timeout=timeout, rtscts=False)
+        if sys.platform == "win32":
+            # Larger driver buffers: one read drains a burst of responses and a
+            # write returns while the driver is still transmitting
+            self.ser.set_buffer_size(rx_size=65536, tx_size=65536)
+        # Byte lengths of lines sent to GRBL that have not been acknowledged yet
+        self._inflight: Deque[int] = deque()
+        # Trailing bytes of an incomplete response, completed by the next read
+        self._rx_residual = b""
         self._wake_up()
 
     def __enter__(self) -> "XYPlotter":
@@ -78,56 +96,115 @@ class XYPlotter:
         self.ser.write(b"\r\n\r\n")
         time.sleep(2)
         self.ser.flushInput()
+        self._rx_residual = b""
 
     def send_gcode(self, command: str) -> None:
         """Send a raw G-code line."""
         if not command.endswith("\n"):
             command = f"{command}\n"
-        self.ser.write(command.encode())
+        self._stream(command.encode())
+
+    def _stream(self, line: bytes) -> None:
+        """Send a line once GRBL's RX buffer has room for it (character-counting protocol)."""
+        self._stream_many((line,))
+
+    def _stream_many(self, lines: Iterable[bytes]) -> None:
+        """Stream lines, joining as many as fit in GRBL's RX buffer into one write."""
+        lines = iter(lines)
+        ahead: Deque[bytes] = deque()
+        batch = []
+        while True:
+            line = ahead.popleft() if ahead else next(lines, None)
+            if line is None:
+                break
+            while self._inflight and sum(self._inflight) + len(line) >= self.RX_BUFFER_SIZE:
+                if batch:
+                    self.ser.write(b"".join(batch))
+                    batch = []
+                # Format upcoming lines while the bytes are on the wire and no ack is in yet
+                while len(ahead) < self.LOOKAHEAD_LINES and not self.ser.in_waiting:
+                    upcoming = next(lines, None)
+                    if upcoming is None:
+                        break
+                    ahead.append(upcoming)
+                self._read_ok()
+            batch.append(line)
+            self._inflight.append(len(line))
+        if batch:
+            self.ser.write(b"".join(batch))
+
+    def _read_ok(self) -> str:
+        """Wait for the next ok/error response and release its line from the RX buffer count."""
+        while True:
+            line = self._rx_residual + self.ser.readline()
+            if not line.endswith(b"\n"):
+                # readline() timed out mid-line; keep the fragment until the rest arrives
+                self._rx_residual = line
+                continue
+            self._rx_residual = b""
+            response = line.decode(errors="ignore").strip()
+            if response.startswith("ok") or response.startswith("error"):
+                self._inflight.popleft()
+                return response
+
+    def _drain(self) -> None:
+        """Wait until GRBL has acknowledged every streamed line."""
+        while self._inflight:
+            self._read_ok()
 
     def wait_till_idle(
         self,
-        poll_interval: float = 0.1,
+        poll_interval: float = 0.02,
         verbose: bool = False,
         show_position: bool = True,
     ) -> None:
         """Poll GRBL status until the controller reports Idle."""
         while True:
             time.sleep(poll_interval)
-            self.ser.flushInput()
-            self.ser.write(b"?\n")
-            response = self.ser.readline().decode(errors="ignore").strip()
-            if verbose and response:
-                print(response)
-            if show_position and response:
+            self.ser.write(b"?")  # real-time command: answered immediately, no ok
+            data = self._rx_residual + self.ser.read_until(b">", size=256)
+            # Acks for streamed lines may arrive ahead of (or right after) the report
+            if self.ser.in_waiting:
+                data += self.ser.read(self.ser.in_waiting)
+            # Keep a partial line or status frame for the next read instead of losing it
+            cut = max(data.rfind(b"\n"), data.rfind(b">")) + 1
+            data, self._rx_residual = data[:cut], data[cut:]
+            self._release_acks(data)
+
+            end = data.rfind(b">")
+            start = data.rfind(b"<", 0, end)
+            if start < 0 or end < 0:
+                continue
+            response = data[start : end + 1]
+            if verbose:
+                print(response.decode(errors="ignore"))
+            if show_position:
                 status_line = _format_status_position(response)
                 if status_line:
                     print(status_line, end="\r", flush=True)
-            if "Idle" in response:
+            if b"Idle" in response:
                 if show_position:
                     print(" " * 80, end="\r", flush=True)
                 break
 
+    def _release_acks(self, data: bytes) -> None:
+        """Drop one in-flight line per ok/error found in raw controller output."""
+        for line in data.splitlines():
+            line = line.strip()
+            if (line.startswith(b"ok") or line.startswith(b"error")) and self._inflight:
+                self._inflight.popleft()
+
     def home(self) -> None:
         """Home the plotter and zero the work coordinate system."""
-        self.send_gcode("G54")
-        self.send_gcode("?")
-        self.wait_till_idle()
-
-        self.send_gcode("$H")
-        self.wait_till_idle()
-
-        self.send_gcode("G10 P0 L20 X0 Y0 Z0")
-        self.wait_till_idle()
-
-        self.send_gcode("G54")
-        self.send_gcode("?")
+        # Homing is the only slow step; the zeroing commands queue up behind it in GRBL,
+        # which acknowledges $H once the cycle has finished
+        self._stream_many((b"$H\n", b"G10 P0 L20 X0 Y0 Z0\n", b"G54\n"))
+        self._drain()
         self.wait_till_idle()
 
     def move(self, x: float, y: float, feed_rate: float = 20.0, wait_idle: bool = True) -> None:
         """Rapid move to an XY coordinate."""
-        command = f"G0 X{x:.3f} Y{y:.3f} F{feed_rate}\n"
-        self.ser.write(command.encode())
+        self._stream(self._G0_FMT % (x, y, feed_rate))
         if wait_idle:
             self.wait_till_idle()
 
@@ -142,48 +219,64 @@ class XYPlotter:
         dwell: float = 0.0,
         wait_idle: bool = True,
     ) -> None:
-        """Execute a pattern (callable or name) over the provided work area."""
+        """
+        Execute a pattern (callable or name) over the provided work area.
+
+        Moves are streamed so GRBL's planner can blend them; with ``wait_idle`` the
+        call returns once the controller has finished the whole pattern. Registered
+        and array-backed patterns are sent from their cached array; other callables
+        are streamed as they yield points.
+        """
         generator = resolve_pattern(pattern)
-        for x, y in generator(area):
-            self.move(x, y, feed_rate=feed_rate, wait_idle=wait_idle)
-            if dwell > 0:
-                time.sleep(dwell)
+        registered = any(value is generator for value in PATTERN_REGISTRY.values())
+        if registered or hasattr(generator, "_array_impl"):
+            points = pattern_array(area, generator)
+            self.run_pattern_array(points, feed_rate=feed_rate, dwell=dwell, wait_idle=wait_idle)
+            return
+
+        self._stream_many(self._move_lines(generator(area), feed_rate, dwell))
+        self._drain()
+        if wait_idle:
+            self.wait_till_idle()
+
+    def run_pattern_array(
+        self,
+        points: np.ndarray,
+        feed_rate: float = 20.0,
+        dwell: float = 0.0,
+        wait_idle: bool = True,
+    ) -> None:
+        """Stream an (N, 2) array of XY points, e.g. from one of the ``*_array`` patterns."""
+        # tolist() hands back Python floats in one pass, cheaper than indexing rows
+        self._stream_many(self._move_lines(np.asarray(points).tolist(), feed_rate, dwell))
+        self._drain()
+        if wait_idle:
+            self.wait_till_idle()
+
+    def _move_lines(
+        self, points: Iterable[Point], feed_rate: float, dwell: float
+    ) -> Iterator[bytes]:
+        """Format G0 lines, each followed by a G4 dwell (in seconds) when requested."""
+        fmt = self._G0_FMT
+        # GRBL runs G4 once the preceding move completes, so the dwell needs no host wait
+        dwell_line = b"G4 P%.3f\n" % dwell if dwell > 0 else None
+        for x, y in points:
+            yield fmt % (x, y, feed_rate)
+            if dwell_line:
+                yield dwell_line
 
     def close(self) -> None:
         if self.ser and self.ser.is_open:
             self.ser.close()
 
 
-def _format_status_position(response: str) -> Optional[str]:
+def _format_status_position(response: bytes) -> Optional[str]:
     """Extract a concise status line with position from a GRBL status response."""
-    if not response.startswith("<") or not response.endswith(">"):
+    match = _STATUS_RE.search(response)
+    if match is None:
         return None
-
-    fields = response[1:-1].split("|")
-    if not fields:
-        return None
-
-    state = fields[0].strip()
-    label = None
-    position = None
-    for field in fields[1:]:
-        if field.startswith("WPos:"):
-            label = "WPos"
-            position = field[5:]
-            break
-        if field.startswith("MPos:"):
-            label = "MPos"
-            position = field[5:]
-            break
-
-    if not position or not label:
-        return None
-
-    coords = [coord.strip() for coord in position.split(",") if coord.strip()]
-    formatted = ", ".join(coords[:3]) if coords else position.strip()
-    if state:
-        return f"{state} {label}: {formatted}"
-    return f"{label}: {formatted}"
+    coords = b", ".join(match[3].split(b",")[:3])
+    return f"{match[1].decode()} {match[2].decode()}Pos: {coords.decode()}"
 
 
 def wait_till_go_from_server(
@@ -191,41 +284,102 @@ def wait_till_go_from_server(
     sync_port: int = 5557,
     alive_port: int = 5558,
     identity: str = "ROVER",
+    max_poll_interval: float = 2.0,
 ) -> Tuple[str, str]:
-    """Synchronize with a remote server before starting motion."""
+    """
+    Synchronize with a remote server before starting motion.
+
+    Waits in bounded polls rather than one blocking receive, so Ctrl-C is honored and
+    the ALIVE message is re-sent (with growing intervals) until the server replies to it.
+    """
     context = zmq.Context.instance()
 
-    sync_socket = context.socket(zmq.SUB)
-    alive_socket = context.socket(zmq.REQ)
+    def connect_alive() -> "zmq.Socket":
+        socket = context.socket(zmq.REQ)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(f"tcp://{server_ip}:{alive_port}")
+        poller.register(socket, zmq.POLLIN)
+        return socket
 
+    poller = zmq.Poller()
+    sync_socket = context.socket(zmq.SUB)
     sync_socket.connect(f"tcp://{server_ip}:{sync_port}")
-    alive_socket.connect(f"tcp://{server_ip}:{alive_port}")
     sync_socket.subscribe("")
+    poller.register(sync_socket, zmq.POLLIN)
+    alive_socket = connect_alive()
 
-    alive_socket.send_string(identity)
-    meas_id, unique_id = sync_socket.recv_string().split(" ")
-
-    alive_socket.close()
-    sync_socket.close()
+    poll_ms = 100
+    acknowledged = False
+    try:
+        alive_socket.send_string(identity)
+        while True:
+            events = dict(poller.poll(timeout=poll_ms))
+            if sync_socket in events:
+                break
+            if alive_socket in events:
+                # The server has seen this rover; only the SYNC is left to wait for
+                alive_socket.recv()
+                acknowledged = True
+                continue
+            if not acknowledged:
+                # A REQ socket cannot send twice without a reply; reconnect to resend ALIVE
+                poller.unregister(alive_socket)
+                alive_socket.close()
+                alive_socket = connect_alive()
+                alive_socket.send_string(identity)
+            poll_ms = min(poll_ms * 2, int(max_poll_interval * 1000))
+        meas_id, unique_id = sync_socket.recv_string().split(" ")
+    finally:
+        alive_socket.close()
+        sync_socket.close()
     return meas_id, unique_id
 
 
+def _drop_repeated_points(points: np.ndarray) -> np.ndarray:
+    """
+    Drop points that land in the same cell as their predecessor.
+
+    Clamping can collapse consecutive points onto an edge; comparing on a grid of
+    ``DEDUP_RESOLUTION`` (below the plotter's positioning resolution) also catches
+    near-duplicates that would otherwise cost a redundant move.
+    """
+    if len(points) < 2:
+        return points
+    keys = np.round(points / DEDUP_RESOLUTION).astype(np.int64)
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(keys[1:] != keys[:-1], axis=1)
+    return points[keep]
+
+
 def serpentine_grid(area: WorkArea, spacing: float) -> Iterator[Point]:
     """Generate a classic zig-zag raster across the work area."""
+    yield from map(tuple, serpentine_grid_array(area, spacing).tolist())
+
+
+def serpentine_grid_array(area: WorkArea, spacing: float) -> np.ndarray:
+    """Array form of :func:`serpentine_grid`, returning all points as an (N, 2) array."""
     if spacing <= 0:
         raise ValueError("Spacing must be positive")
 
     x_values = np.arange(area.xmin, area.xmax + spacing / 2, spacing)
     y_values = np.arange(area.ymin, area.ymax + spacing / 2, spacing)
+    shape = (y_values.size, x_values.size)
 
-    for row_index, y in enumerate(y_values):
-        xs = x_values if row_index % 2 == 0 else x_values[::-1]
-        for x in xs:
-            yield float(x), float(y)
+    # Broadcast x along every row (odd rows reversed) and y down each row
+    points = np.empty(shape + (2,), dtype=np.float64)
+    points[..., 0] = x_values
+    points[1::2, :, 0] = x_values[::-1]
+    points[..., 1] = y_values[:, None]
+    return points.reshape(-1, 2)
 
 
 def concentric_square_rings(area: WorkArea, spacing: float = 80.0) -> Iterator[Point]:
     """Walk concentric square perimeters expanding from the center."""
+    yield from map(tuple, concentric_square_rings_array(area, spacing).tolist())
+
+
+def concentric_square_rings_array(area: WorkArea, spacing: float = 80.0) -> np.ndarray:
+    """Array form of :func:`concentric_square_rings`, returning an (N, 2) array."""
     if spacing <= 0:
         raise ValueError("Spacing must be positive")
 
@@ -233,6 +387,7 @@ def concentric_square_rings(area: WorkArea, spacing: float = 80.0) -> Iterator[P
     max_offset = min(cx - area.xmin, area.xmax - cx, cy - area.ymin, area.ymax - cy)
     offsets = np.arange(0, max_offset + spacing / 2, spacing)
 
+    edges = []
     for offset in offsets:
         left = cx - offset
         right = cx + offset
@@ -240,17 +395,23 @@ def concentric_square_rings(area: WorkArea, spacing: float = 80.0) -> Iterator[P
         top = cy + offset
 
         # Top edge (left -> right)
-        for x in np.arange(left, right + spacing / 2, spacing):
-            yield area.clamp(float(x), float(top))
+        xs = np.arange(left, right + spacing / 2, spacing)
+        edges.append(np.column_stack([xs, np.full_like(xs, top)]))
         # Right edge (top -> bottom)
-        for y in np.arange(top - spacing, bottom - spacing / 2, -spacing):
-            yield area.clamp(float(right), float(y))
+        ys = np.arange(top - spacing, bottom - spacing / 2, -spacing)
+        edges.append(np.column_stack([np.full_like(ys, right), ys]))
         # Bottom edge (right -> left)
-        for x in np.arange(right - spacing, left - spacing / 2, -spacing):
-            yield area.clamp(float(x), float(bottom))
+        xs = np.arange(right - spacing, left - spacing / 2, -spacing)
+        edges.append(np.column_stack([xs, np.full_like(xs, bottom)]))
         # Left edge (bottom -> top)
-        for y in np.arange(bottom + spacing, top + spacing / 2, spacing):
-            yield area.clamp(float(left), float(y))
+        ys = np.arange(bottom + spacing, top + spacing / 2, spacing)
+        edges.append(np.column_stack([np.full_like(ys, left), ys]))
+
+    if not edges:
+        return np.empty((0, 2), dtype=np.float64)
+    points = np.concatenate(edges)
+    points[:, 0], points[:, 1] = area.clamp_array(points[:, 0], points[:, 1])
+    return points
 
 
 def progressive_raster(
@@ -260,20 +421,36 @@ def progressive_raster(
     spacing_decay: float = 0.5,
 ) -> Iterator[Point]:
     """Run multiple raster scans, getting denser on each pass."""
+    yield from map(
+        tuple,
+        progressive_raster_array(area, initial_spacing, passes, spacing_decay).tolist(),
+    )
+
+
+def progressive_raster_array(
+    area: WorkArea,
+    initial_spacing: float = 300.0,
+    passes: int = 4,
+    spacing_decay: float = 0.5,
+) -> np.ndarray:
+    """Array form of :func:`progressive_raster`, with all passes concatenated."""
     if initial_spacing <= 0:
         raise ValueError("Initial spacing must be positive")
     if spacing_decay <= 0:
         raise ValueError("Spacing decay must be positive")
-    if passes < 1:
-        return
 
+    grids = []
     spacing = initial_spacing
     for _ in range(passes):
-        yield from serpentine_grid(area, spacing)
+        grids.append(serpentine_grid_array(area, spacing))
         spacing *= spacing_decay
         if spacing <= 0:
             break
 
+    if not grids:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.concatenate(grids)
+
 
 def center_out_refined_spiral(
     area: WorkArea,
@@ -288,6 +465,22 @@ def center_out_refined_spiral(
     Each revolution expands the radius by the current spacing, then reduces the spacing
     to increase granularity on the next revolution.
     """
+    yield from map(
+        tuple,
+        center_out_refined_spiral_array(
+            area, initial_spacing, spacing_decay, min_spacing, angle_step_deg
+        ).tolist(),
+    )
+
+
+def center_out_refined_spiral_array(
+    area: WorkArea,
+    initial_spacing: float = 250.0,
+    spacing_decay: float = 0.65,
+    min_spacing: float = 35.0,
+    angle_step_deg: float = 6.0,
+) -> np.ndarray:
+    """Array form of :func:`center_out_refined_spiral`, evaluated one revolution at a time."""
     if initial_spacing <= 0:
         raise ValueError("Initial spacing must be positive")
     if min_spacing <= 0:
@@ -305,24 +498,26 @@ def center_out_refined_spiral(
     spacing = initial_spacing
     radius_offset = 0.0
     angle_step = math.radians(angle_step_deg)
+    full_turn = 2 * math.pi
     theta = 0.0
-    last_point: Optional[Point] = None
 
+    revolutions = []
     while radius_offset <= max_radius + spacing:
-        radius = radius_offset + (spacing / (2 * math.pi)) * theta
-        x = cx + radius * math.cos(theta)
-        y = cy + radius * math.sin(theta)
-        point = area.clamp(x, y)
+        # Accumulate the angle like a stepping loop would, then keep the steps below a full turn
+        steps = math.ceil((full_turn - theta) / angle_step) + 2
+        thetas = np.cumsum(np.concatenate(([theta], np.full(steps, angle_step))))
+        turn_end = int(np.argmax(thetas >= full_turn))
+        thetas, theta = thetas[:turn_end], float(thetas[turn_end]) - full_turn
 
-        if point != last_point:
-            yield point
-            last_point = point
+        radius = radius_offset + (spacing / full_turn) * thetas
+        revolutions.append(np.column_stack([cx + radius * np.cos(thetas), cy + radius * np.sin(thetas)]))
 
-        theta += angle_step
-        if theta >= 2 * math.pi:
-            theta -= 2 * math.pi
-            radius_offset += spacing
-            spacing = max(min_spacing, spacing * spacing_decay)
+        radius_offset += spacing
+        spacing = max(min_spacing, spacing * spacing_decay)
+
+    points = np.concatenate(revolutions)
+    points[:, 0], points[:, 1] = area.clamp_array(points[:, 0], points[:, 1])
+    return _drop_repeated_points(points)
 
 
 def radial_spokes(
@@ -332,6 +527,16 @@ def radial_spokes(
     alternate_direction: bool = True,
 ) -> Iterator[Point]:
     """Trace repeated rays from the center outward, expanding radius each lap."""
+    yield from map(tuple, radial_spokes_array(area, rays, radial_step, alternate_direction).tolist())
+
+
+def radial_spokes_array(
+    area: WorkArea,
+    rays: int = 24,
+    radial_step: float = 60.0,
+    alternate_direction: bool = True,
+) -> np.ndarray:
+    """Array form of :func:`radial_spokes`, starting with the center point."""
     if rays < 1:
         raise ValueError("Number of rays must be positive")
     if radial_step <= 0:
@@ -345,20 +550,20 @@ def radial_spokes(
         area.ymax - cy,
     )
 
-    yield cx, cy
-    ray_indices = list(range(rays))
-    radius = radial_step
-    toggle = False
+    laps = int((max_radius + radial_step) // radial_step)
+    radii = radial_step * np.arange(1, laps + 1)
+    angles = (2 * math.pi * np.arange(rays)) / rays
+
+    xs = cx + radii[:, None] * np.cos(angles)[None, :]
+    ys = cy + radii[:, None] * np.sin(angles)[None, :]
+    if alternate_direction:
+        xs[1::2] = xs[1::2, ::-1]
+        ys[1::2] = ys[1::2, ::-1]
 
-    while radius <= max_radius + radial_step:
-        indices = ray_indices if not (alternate_direction and toggle) else ray_indices[::-1]
-        for idx in indices:
-            angle = (2 * math.pi * idx) / rays
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            yield area.clamp(x, y)
-        toggle = not toggle
-        radius += radial_step
+    points = np.empty((xs.size + 1, 2), dtype=np.float64)
+    points[0] = (cx, cy)
+    points[1:, 0], points[1:, 1] = area.clamp_array(xs.ravel(), ys.ravel())
+    return _drop_repeated_points(points)
 
 
 def phyllotaxis_fill(
@@ -372,8 +577,18 @@ def phyllotaxis_fill(
 
     Useful for a fast, center-out sweep with roughly uniform density.
     """
+    yield from map(tuple, phyllotaxis_fill_array(area, points, step, angle_deg).tolist())
+
+
+def phyllotaxis_fill_array(
+    area: WorkArea,
+    points: int = 500,
+    step: float = 22.0,
+    angle_deg: float = 137.5,
+) -> np.ndarray:
+    """Array form of :func:`phyllotaxis_fill`, returning at most ``points`` rows."""
     if points < 1:
-        return
+        return np.empty((0, 2), dtype=np.float64)
     if step <= 0:
         raise ValueError("Step must be positive")
     if angle_deg <= 0:
@@ -386,16 +601,19 @@ def phyllotaxis_fill(
         cy - area.ymin,
         area.ymax - cy,
     )
-    angle = math.radians(angle_deg)
 
-    for n in range(points):
-        radius = step * math.sqrt(n)
-        if radius > max_radius:
-            break
-        theta = n * angle
-        x = cx + radius * math.cos(theta)
-        y = cy + radius * math.sin(theta)
-        yield area.clamp(x, y)
+    n = np.arange(points)
+    radius = step * np.sqrt(n)
+    # Radius grows monotonically, so the cut-off is a prefix
+    inside = radius <= max_radius
+    n, radius = n[inside], radius[inside]
+    theta = n * math.radians(angle_deg)
+
+    result = np.empty((n.size, 2), dtype=np.float64)
+    result[:, 0], result[:, 1] = area.clamp_array(
+        cx + radius * np.cos(theta), cy + radius * np.sin(theta)
+    )
+    return result
 
 
 def hilbert_curve(area: WorkArea, order: int = 6) -> Iterator[Point]:
@@ -404,6 +622,15 @@ def hilbert_curve(area: WorkArea, order: int = 6) -> Iterator[Point]:
 
     Higher order increases coverage density: total points = (2**order)^2.
     """
+    yield from map(tuple, hilbert_curve_array(area, order).tolist())
+
+
+def hilbert_curve_array(area: WorkArea, order: int = 6) -> np.ndarray:
+    """
+    Array form of :func:`hilbert_curve`, returning all points as an (N, 2) array.
+
+    The Hilbert index is decoded for every point at once with NumPy bit operations.
+    """
     if order < 1:
         raise ValueError("Order must be >= 1")
 
@@ -416,30 +643,29 @@ def hilbert_curve(area: WorkArea, order: int = 6) -> Iterator[Point]:
     origin_x = (area.xmin + area.xmax - size) / 2
     origin_y = (area.ymin + area.ymax - size) / 2
 
-    def d2xy(n: int, d: int) -> Tuple[int, int]:
-        """Convert Hilbert distance to (x, y) on n x n grid."""
-        x = y = 0
-        t = d
-        s = 1
-        while s < n:
-            rx = 1 & (t // 2)
-            ry = 1 & (t ^ rx)
-            if ry == 0:
-                if rx == 1:
-                    x, y = s - 1 - x, s - 1 - y
-                x, y = y, x
-            x += s * rx
-            y += s * ry
-            t //= 4
-            s *= 2
-        return x, y
+    t = np.arange(total_points, dtype=np.int64)
+    gx = np.zeros_like(t)
+    gy = np.zeros_like(t)
+    s = 1
+    while s < grid_size:
+        rx = (t >> 1) & 1
+        ry = (t ^ rx) & 1
+        flip = ry == 0
+        mirror = flip & (rx == 1)
+        gx = np.where(mirror, s - 1 - gx, gx)
+        gy = np.where(mirror, s - 1 - gy, gy)
+        gx, gy = np.where(flip, gy, gx), np.where(flip, gx, gy)
+        gx += s * rx
+        gy += s * ry
+        t >>= 2
+        s <<= 1
 
     denom = max(grid_size - 1, 1)
-    for d in range(total_points):
-        gx, gy = d2xy(grid_size, d)
-        x = origin_x + (gx / denom) * size
-        y = origin_y + (gy / denom) * size
-        yield area.clamp(x, y)
+    points = np.empty((total_points, 2), dtype=np.float64)
+    points[:, 0], points[:, 1] = area.clamp_array(
+        origin_x + (gx / denom) * size, origin_y + (gy / denom) * size
+    )
+    return _drop_repeated_points(points)
 
 
 def resolve_pattern(pattern: PatternInput) -> PatternGenerator:
@@ -456,20 +682,123 @@ def resolve_pattern(pattern: PatternInput) -> PatternGenerator:
     return pattern
 
 
+def pattern_array(area: WorkArea, pattern: PatternInput = None) -> np.ndarray:
+    """
+    Return the points of a pattern as a read-only (N, 2) array.
+
+    Registered patterns are memoized per work area, so repeated runs skip the
+    generator entirely. The built-in patterns are also kept as ``.npy`` files under
+    ``PATTERN_CACHE_DIR``, keyed by this module's source and the NumPy version.
+    Unregistered callables are evaluated on every call.
+    """
+    generator = resolve_pattern(pattern)
+    if not any(value is generator for value in PATTERN_REGISTRY.values()):
+        return _evaluate_pattern(generator, area)
+    return _cached_pattern_array(generator, area)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_pattern_array(generator: PatternGenerator, area: WorkArea) -> np.ndarray:
+    name = next((key for key, value in _BUILTIN_PATTERNS.items() if value is generator), None)
+    if name is None:
+        return _evaluate_pattern(generator, area)
+
+    key = repr((_module_digest(), np.__version__, name, area.width, area.height, area.margin))
+    path = PATTERN_CACHE_DIR / f"{hashlib.blake2b(key.encode()).hexdigest()[:16]}.npy"
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        pass
+
+    points = _evaluate_pattern(generator, area)
+    try:
+        PATTERN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write under a temporary name so a concurrent reader never sees a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fh:
+            np.save(fh, points)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # caching is best effort, e.g. on a read-only home directory
+    return points
+
+
+@functools.lru_cache(maxsize=None)
+def _module_digest() -> str:
+    """Hash of this module's source, so any edit to a built-in pattern invalidates the cache."""
+    return hashlib.blake2b(Path(__file__).read_bytes()).hexdigest()
+
+
+def _evaluate_pattern(generator: PatternGenerator, area: WorkArea) -> np.ndarray:
+    """Evaluate a pattern into a read-only (N, 2) float array, preferring its array form."""
+    array_impl = getattr(generator, "_array_impl", None)
+    points = array_impl(area) if array_impl is not None else generator(area)
+    if isinstance(points, np.ndarray):
+        arr = np.array(points, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError(f"Pattern points must have shape (N, 2), got {arr.shape}")
+    else:
+        flat = np.fromiter(_flatten_points(points), dtype=np.float64)
+        arr = flat.reshape(-1, 2)
+    arr.flags.writeable = False
+    return arr
+
+
+def _flatten_points(points: Iterable[Point]) -> Iterator[float]:
+    for point in points:
+        if len(point) != 2:
+            raise ValueError(f"Pattern points must be (x, y) pairs, got {point!r}")
+        yield from point
+
+
+def _with_array_impl(generator: PatternGenerator, array_impl: Callable) -> PatternGenerator:
+    """Attach the ``*_array`` form of a pattern so array consumers can skip the generator."""
+    generator._array_impl = array_impl  # type: ignore[attr-defined]
+    return generator
+
+
 def available_patterns() -> Tuple[str, ...]:
-    """List registered pattern names."""
-    return tuple(PATTERN_REGISTRY.keys())
+    """List registered pattern names, leaving out the ``*_array`` aliases."""
+    return tuple(
+        name
+        for name in PATTERN_REGISTRY
+        if not (name.endswith("_array") and name[: -len("_array")] in PATTERN_REGISTRY)
+    )
+
+
+for _generator, _array_impl in (
+    (serpentine_grid, serpentine_grid_array),
+    (concentric_square_rings, concentric_square_rings_array),
+    (progressive_raster, progressive_raster_array),
+    (center_out_refined_spiral, center_out_refined_spiral_array),
+    (radial_spokes, radial_spokes_array),
+    (phyllotaxis_fill, phyllotaxis_fill_array),
+    (hilbert_curve, hilbert_curve_array),
+):
+    _with_array_impl(_generator, _array_impl)
 
 
 DEFAULT_PATTERN = center_out_refined_spiral
 PATTERN_REGISTRY: Dict[str, PatternGenerator] = {
     "center_out_refined_spiral": center_out_refined_spiral,
-    "serpentine_100": lambda area: serpentine_grid(area, spacing=100.0),
-    "progressive_raster": lambda area: progressive_raster(
-        area, initial_spacing=300.0, passes=4, spacing_decay=0.6
+    "serpentine_100": _with_array_impl(
+        lambda area: serpentine_grid(area, spacing=100.0),
+        lambda area: serpentine_grid_array(area, spacing=100.0),
+    ),
+    "progressive_raster": _with_array_impl(
+        lambda area: progressive_raster(area, initial_spacing=300.0, passes=4, spacing_decay=0.6),
+        lambda area: progressive_raster_array(
+            area, initial_spacing=300.0, passes=4, spacing_decay=0.6
+        ),
     ),
     "concentric_squares": concentric_square_rings,
     "radial_spokes": radial_spokes,
     "phyllotaxis": phyllotaxis_fill,
     "hilbert": hilbert_curve,
 }
+# Each pattern is also registered under "<name>_array", returning its points as an ndarray
+PATTERN_REGISTRY.update(
+    {f"{name}_array": generator._array_impl for name, generator in list(PATTERN_REGISTRY.items())}
+)
+# Patterns shipped with the library; only these are cached on disk
+_BUILTIN_PATTERNS: Dict[str, PatternGenerator] = dict(PATTERN_REGISTRY)